@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import stat
-import struct
 
 from dissect.cstruct import cstruct
 
@@ -379,10 +378,9 @@ FileType = c_vmfs.FileType
 
 def bsf(value: int, size: int = 32) -> int:
     """Count the number of zero bits in an integer of a given size."""
-    for i in range(size):
-        if value & (1 << i):
-            return i
-    return 0
+    value &= (1 << size) - 1
+    # Isolate the lowest set bit, its bit length is then the index of that bit plus one
+    return (value & -value).bit_length() - 1 if value else 0
 
 
 def type_to_mode(type_: FileType) -> int:
@@ -394,5 +392,9 @@ def type_to_mode(type_: FileType) -> int:
 
 
 def vmfs_uuid(buf: bytes) -> str:
-    uuid1, uuid2, uuid3, uuid4 = struct.unpack("<IIH6s", buf)
-    return f"{uuid1:08x}-{uuid2:08x}-{uuid3:04x}-{uuid4.hex()}"
+    if len(buf) != 16:
+        raise ValueError(f"Invalid VMFS UUID length: {len(buf)}")
+
+    # Equivalent to unpacking as <IIH6s, the little endian fields are byte swapped by reordering the hex digits
+    h = buf.hex()
+    return f"{h[6:8]}{h[4:6]}{h[2:4]}{h[0:2]}-{h[14:16]}{h[12:14]}{h[10:12]}{h[8:10]}-{h[18:20]}{h[16:18]}-{h[20:32]}"
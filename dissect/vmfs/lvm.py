@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from bisect import bisect_right
+from operator import attrgetter
 from typing import BinaryIO
 
 from dissect.util.stream import AlignedStream
@@ -53,26 +54,35 @@ class LVM(AlignedStream):
         if not self.extents:
             raise ValueError("No extents")
 
-        self.extents.sort(key=lambda e: e.first_pe)
-        self._extent_pe_offsets = [e.first_pe for e in self.extents if e.first_pe != 0]
+        self.extents.sort(key=attrgetter("first_pe"))
+        # Precompute the logical byte offset of each extent, so we don't have to calculate them on every read
+        self._extent_starts = [e.first_pe * VMFS_LVM_PE_SIZE for e in self.extents]
+        self._extent_offsets = [start for start in self._extent_starts if start != 0]
+        # Read directly from the underlying file-like objects, the extent streams would only add another buffer
+        self._extent_fhs = [(e.fh, e.metadata.dataOffset, e.size) for e in self.extents]
 
         super().__init__(size)
 
     def _read(self, offset: int, length: int) -> bytes:
-        r = []
+        extent_idx = bisect_right(self._extent_offsets, offset)
 
-        pe_offset = offset // VMFS_LVM_PE_SIZE
+        fh, data_offset, extent_size = self._extent_fhs[extent_idx]
+        offset_in_extent = offset - self._extent_starts[extent_idx]
+        if offset_in_extent + length <= extent_size:
+            # Most reads don't cross an extent boundary, so we can read them in one go
+            fh.seek(data_offset + offset_in_extent)
+            return fh.read(length)
 
-        extent_idx = bisect_right(self._extent_pe_offsets, pe_offset)
+        r = []
         while length > 0:
-            extent = self.extents[extent_idx]
+            fh, data_offset, extent_size = self._extent_fhs[extent_idx]
 
-            offset_in_extent = offset - (extent.first_pe * VMFS_LVM_PE_SIZE)
-            remaining_in_extent = extent.size - offset_in_extent
+            offset_in_extent = offset - self._extent_starts[extent_idx]
+            remaining_in_extent = extent_size - offset_in_extent
 
             read_length = min(length, remaining_in_extent)
-            extent.seek(offset_in_extent)
-            r.append(extent.read(read_length))
+            fh.seek(data_offset + offset_in_extent)
+            r.append(fh.read(read_length))
 
             length -= read_length
             offset += read_length
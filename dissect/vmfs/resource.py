@@ -1,15 +1,48 @@
 from __future__ import annotations
 
+import io
+import os
+import struct
+from functools import lru_cache
 from typing import TYPE_CHECKING, BinaryIO
 
-from dissect.vmfs.c_vmfs import FileType, ResourceType, c_vmfs
+from dissect.vmfs.c_vmfs import ADDRESS_TYPE_MASK, FileType, ResourceType, c_vmfs
 from dissect.vmfs.exceptions import FileNotFoundError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
     from dissect.vmfs.vmfs import VMFS
 
+# Plain int values of the resource types, comparing and hashing enum members is a lot slower than plain ints
+_FB = int(ResourceType.FB)
+_SB = int(ResourceType.SB)
+_PB = int(ResourceType.PB)
+_FD = int(ResourceType.FD)
+_PB2 = int(ResourceType.PB2)
+_JB = int(ResourceType.JB)
+_LFB = int(ResourceType.LFB)
+
+# Default size up to which resource files are read into memory entirely on first use
+RESOURCE_PRELOAD_LIMIT = 8 * 1024 * 1024
+# Default amount of resource data to keep in the read cache of a single resource
+RESOURCE_CACHE_SIZE = 16 * 1024 * 1024
+
+
+def _pread_fileno(fh: BinaryIO) -> int | None:
+    """Return the file descriptor to use with ``os.pread`` for reading ``fh``, if possible.
+
+    Only plain files qualify. Other file-like objects can have a file descriptor too (e.g. ``gzip.GzipFile``),
+    but reading from that descriptor doesn't return the same data as reading from the file-like object.
+    """
+    if not hasattr(os, "pread"):
+        return None
+
+    raw = fh.raw if isinstance(fh, io.BufferedReader) else fh
+    if not isinstance(raw, io.FileIO):
+        return None
+    return raw.fileno()
+
 
 def address_type(addr: int) -> int:
     """Return the address type.
@@ -25,51 +58,63 @@ def address_fmt(vmfs: VMFS, address: int) -> str:
     References:
     - Addr3_AddrToStr and similar
     """
-    addr_type = address_type(address)
-    cow_mask = c_vmfs.ADDRESS_FLAG_COW
+    return _ADDRESS_FMT[address & ADDRESS_TYPE_MASK](vmfs, address)
+
 
-    if addr_type == ResourceType.FB:
-        tbz = address_tbz(vmfs, address)
-        cow = address & cow_mask != 0
-        if vmfs.is_vmfs5:
-            block = parse_fb_address(vmfs, address)
-            return f"<FB tbz={tbz != 0} cow={cow} {block}>"
-        cluster, resource = parse_sfb_address(vmfs, address)
-        return f"<SFB tbz=0x{tbz:x} cow={cow} c{cluster} r{resource}>"
+def _fmt_null(vmfs: VMFS, address: int) -> str:
+    return "<Null address>"
+
+
+def _fmt_fb(vmfs: VMFS, address: int) -> str:
+    # The address type is already known here, so don't go through address_tbz
+    cow = address & c_vmfs.ADDRESS_FLAG_COW != 0
+    if vmfs.is_vmfs5:
+        tbz = address & c_vmfs.ADDRESS_FLAG_TBZ
+        block = parse_fb_address(vmfs, address)
+        return f"<FB tbz={tbz != 0} cow={cow} {block}>"
+    tbz = (address & c_vmfs.ADDRESS_FLAG_TBZ_VMFS6) >> 7
+    cluster, resource = parse_sfb_address(vmfs, address)
+    return f"<SFB tbz=0x{tbz:x} cow={cow} c{cluster} r{resource}>"
 
-    if addr_type == ResourceType.SB:
-        cow = address & cow_mask != 0
-        cluster, resource = parse_sb_address(vmfs, address)
-        return f"<SB cow={cow} c{cluster} r{resource}>"
 
-    if addr_type == ResourceType.PB:
-        cow = address & cow_mask != 0
-        cluster, resource = parse_pb_address(vmfs, address)
-        return f"<PB cow={cow} c{cluster} r{resource}>"
+def _fmt_sb(vmfs: VMFS, address: int) -> str:
+    cow = address & c_vmfs.ADDRESS_FLAG_COW != 0
+    cluster, resource = parse_sb_address(vmfs, address)
+    return f"<SB cow={cow} c{cluster} r{resource}>"
 
-    if addr_type == ResourceType.FD:
-        cluster, resource = parse_fd_address(vmfs, address)
-        return f"<FD c{cluster} r{resource}>"
 
-    if addr_type == ResourceType.PB2:
-        cow = address & cow_mask != 0
-        cluster, resource = parse_pb_address(vmfs, address)
-        return f"<PB2 cow={cow} c{cluster} r{resource}>"
+def _fmt_pb(vmfs: VMFS, address: int) -> str:
+    cow = address & c_vmfs.ADDRESS_FLAG_COW != 0
+    cluster, resource = parse_pb_address(vmfs, address)
+    return f"<PB cow={cow} c{cluster} r{resource}>"
 
-    if addr_type == ResourceType.JB:
-        cluster, resource = parse_jb_address(vmfs, address)
-        return f"<JB c{cluster} r{resource}>"
 
-    if addr_type == ResourceType.LFB:
-        tbz = address_tbz(vmfs, address)
-        cow = address & cow_mask != 0
-        block = parse_lfb_address(vmfs, address)
-        return f"<LFB tbz=0x{tbz:x} cow={cow} {block}>"
+def _fmt_fd(vmfs: VMFS, address: int) -> str:
+    cluster, resource = parse_fd_address(vmfs, address)
+    return f"<FD c{cluster} r{resource}>"
 
-    if addr_type == 0:
-        return "<Null address>"
 
-    return f"<Invalid address 0x{address:x}>"
+def _fmt_pb2(vmfs: VMFS, address: int) -> str:
+    cow = address & c_vmfs.ADDRESS_FLAG_COW != 0
+    cluster, resource = parse_pb_address(vmfs, address)
+    return f"<PB2 cow={cow} c{cluster} r{resource}>"
+
+
+def _fmt_jb(vmfs: VMFS, address: int) -> str:
+    cluster, resource = parse_jb_address(vmfs, address)
+    return f"<JB c{cluster} r{resource}>"
+
+
+def _fmt_lfb(vmfs: VMFS, address: int) -> str:
+    # LFB addresses only exist on VMFS6
+    tbz = (address & c_vmfs.ADDRESS_FLAG_TBZ_VMFS6) >> 7
+    cow = address & c_vmfs.ADDRESS_FLAG_COW != 0
+    block = parse_lfb_address(vmfs, address)
+    return f"<LFB tbz=0x{tbz:x} cow={cow} {block}>"
+
+
+# Indexed by address type, every possible value of the 3 address type bits has an entry
+_ADDRESS_FMT = (_fmt_null, _fmt_fb, _fmt_sb, _fmt_pb, _fmt_fd, _fmt_pb2, _fmt_jb, _fmt_lfb)
 
 
 def address_tbz(vmfs: VMFS, address: int) -> int | None:
@@ -79,9 +124,9 @@ def address_tbz(vmfs: VMFS, address: int) -> int | None:
     """
     addr_type = address_type(address)
 
-    if vmfs.is_vmfs5 and addr_type == ResourceType.FB:
+    if vmfs.is_vmfs5 and addr_type == _FB:
         return address & c_vmfs.ADDRESS_FLAG_TBZ
-    if vmfs.is_vmfs6 and addr_type in (ResourceType.FB, ResourceType.LFB):
+    if vmfs.is_vmfs6 and addr_type in (_FB, _LFB):
         return (address & c_vmfs.ADDRESS_FLAG_TBZ_VMFS6) >> 7
     return None
 
@@ -122,14 +167,28 @@ def parse_sb_address(vmfs: VMFS, address: int) -> tuple[int, int]:
         0b11111111 00000000 00000000 00000000 00000000 00000000 00000000 00000000  (resource)
     """
     if vmfs.is_vmfs5:
-        cluster = (address & 0x0FFFFFC0) >> 6
-        resource = (address & 0xF0000000) >> 28
         if vmfs.descriptor.config & 4:
-            # Don't know what this flag means, maybe extended SB addressing?
-            resource |= ((address & 0b11000) >> 3) << 4
-    else:
-        cluster = (address & 0x000000FFFFFFFFC0) >> 6
-        resource = (address & 0xFF00000000000000) >> 56
+            return _parse_sb_address_vmfs5_extended(address)
+        return _parse_sb_address_vmfs5(address)
+    return _parse_sb_address_vmfs6(address)
+
+
+def _parse_sb_address_vmfs5(address: int) -> tuple[int, int]:
+    cluster = (address & 0x0FFFFFC0) >> 6
+    resource = (address & 0xF0000000) >> 28
+    return cluster, resource
+
+
+def _parse_sb_address_vmfs5_extended(address: int) -> tuple[int, int]:
+    # Don't know what this config flag means, maybe extended SB addressing?
+    cluster = (address & 0x0FFFFFC0) >> 6
+    resource = ((address & 0xF0000000) >> 28) | (((address & 0b11000) >> 3) << 4)
+    return cluster, resource
+
+
+def _parse_sb_address_vmfs6(address: int) -> tuple[int, int]:
+    cluster = (address & 0x000000FFFFFFFFC0) >> 6
+    resource = (address & 0xFF00000000000000) >> 56
     return cluster, resource
 
 
@@ -145,11 +204,19 @@ def parse_pb_address(vmfs: VMFS, address: int) -> tuple[int, int]:
         0b11111111 00000000 00000000 00000000 00000000 00000000 00000000 00000000  (resource)
     """
     if vmfs.is_vmfs5:
-        cluster = (address & 0x0FFFFFC0) >> 6
-        resource = (address & 0xF0000000) >> 28
-    else:
-        cluster = (address & 0x00000FFFFFFFFC0) >> 6
-        resource = (address & 0xFF00000000000000) >> 56
+        return _parse_pb_address_vmfs5(address)
+    return _parse_pb_address_vmfs6(address)
+
+
+def _parse_pb_address_vmfs5(address: int) -> tuple[int, int]:
+    cluster = (address & 0x0FFFFFC0) >> 6
+    resource = (address & 0xF0000000) >> 28
+    return cluster, resource
+
+
+def _parse_pb_address_vmfs6(address: int) -> tuple[int, int]:
+    cluster = (address & 0x00000FFFFFFFFC0) >> 6
+    resource = (address & 0xFF00000000000000) >> 56
     return cluster, resource
 
 
@@ -187,21 +254,36 @@ def parse_lfb_address(vmfs: VMFS, address: int) -> int:
 
 
 class ResourceManager:
-    def __init__(self, vmfs: VMFS):
+    """Open resource files of a VMFS volume and look up resources by address.
+
+    Resource files up to ``preload_limit`` bytes are kept in memory entirely, and each resource keeps up to
+    ``cache_size`` bytes of resource data in its read cache. These default to ``RESOURCE_PRELOAD_LIMIT`` and
+    ``RESOURCE_CACHE_SIZE``.
+    """
+
+    def __init__(self, vmfs: VMFS, preload_limit: int | None = None, cache_size: int | None = None):
         self.vmfs = vmfs
-        self.resources = {}
+        self.preload_limit = RESOURCE_PRELOAD_LIMIT if preload_limit is None else preload_limit
+        self.cache_size = RESOURCE_CACHE_SIZE if cache_size is None else cache_size
+        # Resources are indexed by their address type, which is always in the range 0-7
+        self.resources: list[ResourceFile | None] = [None] * (ADDRESS_TYPE_MASK + 1)
+        # Bound methods of the opened resources, so the hot paths are a single index and call
+        self._get_by_type = [self._not_opened] * (ADDRESS_TYPE_MASK + 1)
+        self._parse_by_type = [self._not_opened] * (ADDRESS_TYPE_MASK + 1)
+        # Some resource types share a resource file (e.g. FB and LFB both use .fbb.sf), so the file objects and
+        # their contents are shared between them
+        self._fileobjs: dict[int, BinaryIO] = {}
+        self._data: dict[int, ResourceFileData] = {}
 
     def open(self, resource_type: ResourceType, address: int | None = None, fileobj: BinaryIO | None = None) -> None:
-        if resource_type in self.resources:
-            raise ValueError(f"Resource already opened: {resource_type}")
-
-        if resource_type not in RESOURCE_TYPE_MAP:
+        type_value = int(resource_type)
+        if type_value not in RESOURCE_TYPE_MAP:
             raise TypeError(f"Don't know how to open resource: {resource_type}")
 
         if not address and not fileobj:
             raise ValueError(f"No address or file object for resource: {resource_type}")
 
-        if not fileobj:
+        if not fileobj and (fileobj := self._fileobjs.get(address)) is None:
             try:
                 fd = self.vmfs.file_descriptor(address)
             except FileNotFoundError:
@@ -215,36 +297,66 @@ class ResourceManager:
             ):
                 return
 
-            fileobj = fd.open()
+            fileobj = self._fileobjs[address] = fd.open()
+
+        if (data := self._data.get(id(fileobj))) is None:
+            data = self._data[id(fileobj)] = ResourceFileData(fileobj, self.preload_limit, self.cache_size)
 
         try:
-            self.resources[resource_type.value] = RESOURCE_TYPE_MAP[resource_type](
-                self.vmfs, resource_type, address, fileobj
-            )
-        except Exception:
+            resource = RESOURCE_TYPE_MAP[type_value](self.vmfs, resource_type, address, fileobj, data)
+        except (EOFError, OSError, ValueError, struct.error):
+            # Truncated or invalid resource metadata, treat the resource as unavailable
             return
 
-    def _get_resource_for_resource_type(self, resource_type: ResourceType) -> ResourceFile:
-        resource_type = int(resource_type)
+        self.resources[type_value] = resource
+        self._get_by_type[type_value] = resource.get
+        self._parse_by_type[type_value] = resource.parse_address
+
+    def __contains__(self, resource_type: ResourceType) -> bool:
+        return self.resources[int(resource_type)] is not None
 
-        if resource_type not in self.resources:
-            raise ValueError(f"No resource opened for type {ResourceType(resource_type)}")
-        return self.resources[resource_type]
+    def _get_resource_for_int(self, addr_type: int) -> ResourceFile:
+        # Internal fast path, addr_type must already be a plain int (e.g. from address_type)
+        if (resource := self.resources[addr_type]) is None:
+            raise ValueError(f"No resource opened for type {ResourceType(addr_type)}")
+        return resource
 
-    def _get_resource_for_address(self, address: int) -> ResourceFile:
-        addr_type = address_type(address)
-        return self._get_resource_for_resource_type(addr_type)
+    def _get_resource_for_resource_type(self, resource_type: ResourceType) -> ResourceFile:
+        return self._get_resource_for_int(int(resource_type))
+
+    def _not_opened(self, address: int) -> None:
+        raise ValueError(f"No resource opened for type {ResourceType(address_type(address))}")
 
     def get(self, address: int) -> bytes:
-        resource = self._get_resource_for_address(address)
-        return resource.get(address)
+        return self._get_by_type[address & ADDRESS_TYPE_MASK](address)
+
+    def get_many(self, addresses: Iterable[int]) -> list[bytes]:
+        """Get the resources belonging to the given addresses, in the same order.
+
+        Adjacent resources are read at once, without going through the read cache of the resources.
+        """
+        addresses = list(addresses)
+        result = [None] * len(addresses)
+
+        indices_by_type = {}
+        for idx, address in enumerate(addresses):
+            indices_by_type.setdefault(address_type(address), []).append(idx)
+
+        for addr_type, indices in indices_by_type.items():
+            resource = self._get_resource_for_int(addr_type)
+            for idx, buf in zip(indices, resource.get_many([addresses[idx] for idx in indices])):
+                result[idx] = buf
+
+        return result
 
     def get_resource(self, resource_type: ResourceType, cluster: int, resource: int) -> bytes:
         return self._get_resource_for_resource_type(resource_type).get_resource(cluster, resource)
 
+    def get_resources(self, resource_type: ResourceType, locations: Iterable[tuple[int, int]]) -> list[bytes]:
+        return self._get_resource_for_resource_type(resource_type).get_resources(locations)
+
     def parse_address(self, address: int) -> tuple[int, int]:
-        resource = self._get_resource_for_address(address)
-        return resource.parse_address(address)
+        return self._parse_by_type[address & ADDRESS_TYPE_MASK](address)
 
     @property
     def fdc(self) -> FileDescriptorResource:
@@ -275,6 +387,49 @@ class ResourceManager:
         return self._get_resource_for_resource_type(ResourceType.JB)
 
 
+class ResourceFileData:
+    """The contents of a resource file, shared by all resources that are read from the same file.
+
+    Small resource files are read into memory entirely on the first read, so reading a resource is just a slice.
+    The limits are the same as those of ``ResourceManager``.
+    """
+
+    def __init__(self, fh: BinaryIO, preload_limit: int | None = None, cache_size: int | None = None):
+        self.fh = fh
+        self.preload_limit = RESOURCE_PRELOAD_LIMIT if preload_limit is None else preload_limit
+        self.cache_size = RESOURCE_CACHE_SIZE if cache_size is None else cache_size
+        self._loaded = False
+        self._buffer = None
+        self._fileno = None
+
+    def _load(self) -> None:
+        self._loaded = True
+        if self.fh.seek(0, io.SEEK_END) <= self.preload_limit:
+            self.fh.seek(0)
+            self._buffer = self.fh.read()
+        else:
+            # If the resource file is backed by a real file, we can read with a single pread instead of a seek and read
+            self._fileno = _pread_fileno(self.fh)
+
+    @property
+    def preloaded(self) -> bool:
+        """Whether the resource file is kept in memory."""
+        if not self._loaded:
+            self._load()
+        return self._buffer is not None
+
+    def read(self, offset: int, length: int) -> bytes:
+        """Read from the resource file, or from memory if the resource file was preloaded."""
+        if not self._loaded:
+            self._load()
+        if self._buffer is not None:
+            return self._buffer[offset : offset + length]
+        if self._fileno is not None:
+            return os.pread(self._fileno, length, offset)
+        self.fh.seek(offset)
+        return self.fh.read(length)
+
+
 class ResourceFile:
     """VMFS resource file implementation.
 
@@ -284,74 +439,183 @@ class ResourceFile:
     up of the clusters ("bitmaps"), followed by the actual resource items.
     """
 
-    def __init__(self, vmfs: VMFS, resource_type: ResourceType, address: int, fh: BinaryIO):
+    def __init__(
+        self,
+        vmfs: VMFS,
+        resource_type: ResourceType,
+        address: int,
+        fh: BinaryIO,
+        data: ResourceFileData | None = None,
+    ):
         self.vmfs = vmfs
         self.type = resource_type
         self.address = address
         self.fh = fh
+        # Only the metadata is read here, the resource file contents are read on first use
+        self._data = data if data is not None else ResourceFileData(fh)
 
+        # The file object can be shared with other resources, so don't rely on its current position
+        self.fh.seek(0)
         self.metadata = c_vmfs.Res3_Metadata(self.fh)
         if self.vmfs.is_vmfs6 and self.metadata.signature != c_vmfs.VMFS_RESOURCE_META_SIGNATURE:
             raise ValueError("Invalid resource metadata signature")
 
+        # Copy the metadata fields used when calculating offsets, attribute access on cstruct instances is slow
+        self._resource_size = self.metadata.resourceSize
+        self._resource_per_cluster = self.metadata.resourcePerCluster
+        self._clusters_per_group = self.metadata.clustersPerClusterGroup
+        self._cluster_group_size = self.metadata.clusterGroupSize
+        self._first_cluster_group_offset = self.metadata.firstClusterGroupOffset
+
         # Clusters groups contain a meta header for each cluster, followed by the actual cluster data
         if self.vmfs.is_vmfs5:
-            self._cluster_resource_offset = self.metadata.clustersPerClusterGroup << 10
+            self._cluster_header_size = 1 << 10
+        else:
+            self._cluster_header_size = 2 * self.vmfs._md_alignment
+        self._cluster_resource_offset = self._clusters_per_group * self._cluster_header_size
+        # Don't know what this flag means, maybe a compatibility flag for VMFS6 to work with VMFS5 resource files?
+        # If it's set, VMFS6 resource files have an extra level of parent cluster groups
+        self._parent_layout = not self.vmfs.is_vmfs5 and self.metadata.flags & 2 != 0
+        self._cluster_size = self._resource_per_cluster * self._resource_size
+        # The offset of the first resource in the first cluster group, which is where all resource offsets start from
+        self._resource_base = self._first_cluster_group_offset + self._cluster_resource_offset
+        self._resources_per_group = self._clusters_per_group * self._resource_per_cluster
+
+        # The number of clusters per cluster group is usually a power of two, in which case we can
+        # shift and mask instead of using divmod to calculate the cluster group and relative cluster
+        clusters_per_group = self._clusters_per_group
+        if clusters_per_group and clusters_per_group & (clusters_per_group - 1) == 0:
+            self._cpcg_shift = clusters_per_group.bit_length() - 1
+            self._cpcg_mask = clusters_per_group - 1
         else:
-            alignment = 2 * self.vmfs.descriptor.mdAlignment
-            self._cluster_resource_offset = self.metadata.clustersPerClusterGroup * alignment
-        self._cluster_size = self.metadata.resourcePerCluster * self.metadata.resourceSize
+            self._cpcg_shift = None
+            self._cpcg_mask = None
 
     def iter_resource_locations(self) -> Iterator[tuple[int, int]]:
-        resource_per_cluster = self.metadata.resourcePerCluster
+        resource_per_cluster = self._resource_per_cluster
         num_resources = (self.metadata.numResourcesHi << 32) | self.metadata.numResourcesLo
-        for abs_resource in range(num_resources):
-            yield divmod(abs_resource, resource_per_cluster)
+        if num_resources == 0:
+            # Some resource files are empty (e.g. .pb2.sf on a fresh volume) and have no clusters at all
+            return
+        if resource_per_cluster == 0:
+            raise ValueError(f"Resource file has {num_resources} resources but no resources per cluster")
+        num_clusters, remainder = divmod(num_resources, resource_per_cluster)
+        for cluster in range(num_clusters):
+            for resource in range(resource_per_cluster):
+                yield cluster, resource
+        for resource in range(remainder):
+            yield num_clusters, resource
 
     @property
     def resource_size(self) -> int:
-        return self.metadata.resourceSize
+        return self._resource_size
 
     def _cluster_header_offset(self, cluster: int) -> int:
         """Calculate the offset of a specific cluster header into the resource file."""
+        if not self._parent_layout:
+            if self._cpcg_shift is not None:
+                group, rel_cluster = cluster >> self._cpcg_shift, cluster & self._cpcg_mask
+            else:
+                group, rel_cluster = divmod(cluster, self._clusters_per_group)
+
+            group_offset = group * self._cluster_group_size
+            cluster_offset = rel_cluster * self._cluster_header_size
+            return self._first_cluster_group_offset + group_offset + cluster_offset
+
         md = self.metadata
-        if self.vmfs.is_vmfs5:
-            group, rel_cluster = divmod(cluster, md.clustersPerClusterGroup)
-            group_offset = group * md.clusterGroupSize
-            cluster_offset = rel_cluster << 10
-            return md.firstClusterGroupOffset + group_offset + cluster_offset
-        if md.flags & 2 == 0:
-            group, rel_cluster = divmod(cluster, md.clustersPerClusterGroup)
-            group_offset = group * md.clusterGroupSize
-            cluster_offset = rel_cluster * (2 * self.vmfs.descriptor.mdAlignment)
-            return md.firstClusterGroupOffset + group_offset + cluster_offset
         parent_r_per_cg = md.parentResourcesPerCluster * md.parentClustersPerClusterGroup
         group, rel_cluster = divmod(cluster, parent_r_per_cg)
         group_offset = group * md.parentClusterGroupSize
-        cluster_offset = md.parentClustersPerClusterGroup * (2 * self.vmfs.descriptor.mdAlignment) + rel_cluster
-        return md.firstClusterGroupOffset + group_offset + cluster_offset
+        cluster_offset = md.parentClustersPerClusterGroup * self._cluster_header_size + rel_cluster
+        return self._first_cluster_group_offset + group_offset + cluster_offset
 
     def _cluster_group_offset(self, group: int) -> int:
         """Calculate the offset of a specific cluster group into the resource file."""
+        if not self._parent_layout:
+            return self._first_cluster_group_offset + (group * self._cluster_group_size)
+
         md = self.metadata
-        if self.vmfs.is_vmfs5 or (md.flags & 2 == 0):
-            # Don't know what this flag means, maybe a compatibility flag for VMFS6 to work with VMFS5 resource files?
-            return md.firstClusterGroupOffset + (group * md.clusterGroupSize)
-        parent_size = md.parentClustersPerClusterGroup * md.parentSourcesPerCluster // md.clustersPerClusterGroup
+        parent_size = md.parentClustersPerClusterGroup * md.parentResourcesPerCluster // self._clusters_per_group
         parent, rel_group = divmod(group, parent_size)
         parent_offset = parent * md.parentClusterGroupSize
-        alignment = md.parentClustersPerClusterGroup * (2 * self.vmfs.descriptor.mdAlignment)
-        group_offset = rel_group * md.clusterGroupSize
-        return md.firstClusterGroupOffset + parent_offset + group_offset + alignment
+        alignment = md.parentClustersPerClusterGroup * self._cluster_header_size
+        group_offset = rel_group * self._cluster_group_size
+        return self._first_cluster_group_offset + parent_offset + group_offset + alignment
 
     def _resource_offset(self, cluster: int, resource: int) -> int:
         """Calculate the offset of a specific resource into the resource file."""
-        md = self.metadata
-        group, rel_cluster = divmod(cluster, md.clustersPerClusterGroup)
-        group_offset = md.firstClusterGroupOffset + (group * md.clusterGroupSize)
+        if self._cpcg_shift is not None:
+            group, rel_cluster = cluster >> self._cpcg_shift, cluster & self._cpcg_mask
+        else:
+            group, rel_cluster = divmod(cluster, self._clusters_per_group)
+        group_offset = group * self._cluster_group_size
         cluster_offset = rel_cluster * self._cluster_size
-        resource_offset = resource * md.resourceSize
-        return group_offset + self._cluster_resource_offset + cluster_offset + resource_offset
+        resource_offset = resource * self._resource_size
+        return self._resource_base + group_offset + cluster_offset + resource_offset
+
+    def _block_offset(self, block: int) -> int:
+        """Calculate the offset of a specific resource into the resource file, by its absolute resource number.
+
+        This is the same as ``_resource_offset(*divmod(block, resourcePerCluster))``, without the intermediate split.
+        """
+        group, rel_block = divmod(block, self._resources_per_group)
+        return self._resource_base + (group * self._cluster_group_size) + (rel_block * self._resource_size)
+
+    def _address_offset(self, address: int) -> int:
+        """Calculate the offset of the resource belonging to the given address into the resource file."""
+        cluster, resource = self.parse_address(address)
+        return self._resource_offset(cluster, resource)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        """Read from the resource file, or from memory if the resource file was preloaded."""
+        return self._data.read(offset, length)
+
+    def _read_resource(self, offset: int) -> bytes:
+        """Read a single resource at the given offset into the resource file.
+
+        The first read picks how all following reads are done, so this method is replaced on the instance.
+        """
+        # Resources such as pointer blocks and file descriptors are often read repeatedly while traversing files
+        # The cache is bounded by the amount of data, since resource sizes differ a lot between resource types
+        # Preloaded resource files are already in memory, so caching their resources would only keep a second copy
+        if self._data.preloaded:
+            self._read_resource = self._read_resource_uncached
+        else:
+            cache_size = self._data.cache_size // max(self._resource_size, 1)
+            self._read_resource = lru_cache(cache_size)(self._read_resource_uncached)
+        return self._read_resource(offset)
+
+    def _read_resource_uncached(self, offset: int) -> bytes:
+        return self._read(offset, self._resource_size)
+
+    def _read_resources(self, offsets: list[int]) -> list[bytes]:
+        """Read multiple resources at the given offsets into the resource file.
+
+        Resources that are adjacent in the resource file are read using a single read. These reads bypass the
+        read cache of ``_read_resource``, they neither use nor fill it.
+        """
+        size = self._resource_size
+        result = [None] * len(offsets)
+        order = sorted(range(len(offsets)), key=offsets.__getitem__)
+
+        start_idx = 0
+        while start_idx < len(order):
+            start = offsets[order[start_idx]]
+            end = start + size
+
+            end_idx = start_idx + 1
+            while end_idx < len(order) and offsets[order[end_idx]] <= end:
+                end = max(end, offsets[order[end_idx]] + size)
+                end_idx += 1
+
+            buf = self._read(start, end - start)
+            for idx in order[start_idx:end_idx]:
+                rel_offset = offsets[idx] - start
+                result[idx] = buf[rel_offset : rel_offset + size]
+
+            start_idx = end_idx
+
+        return result
 
     def parse_address(self, address: int) -> tuple[int, int]:
         """Parse an address into a cluster/resource pair to use for looking up a resource."""
@@ -359,36 +623,88 @@ class ResourceFile:
 
     def get(self, address: int) -> bytes:
         """Get the resource belonging to the given address."""
-        cluster, resource = self.parse_address(address)
-        return self.get_resource(cluster, resource)
+        return self._read_resource(self._address_offset(address))
+
+    def get_many(self, addresses: Iterable[int]) -> list[bytes]:
+        """Get the resources belonging to the given addresses, in the same order.
+
+        Resources that are adjacent in the resource file are read using a single read, without the read cache.
+        """
+        return self._read_resources([self._address_offset(address) for address in addresses])
 
     def get_resource(self, cluster: int, resource: int) -> bytes:
         """Get the resource belonging to the given cluster/resource pair."""
-        offset = self._resource_offset(cluster, resource)
-        self.fh.seek(offset)
-        return self.fh.read(self.metadata.resourceSize)
+        return self._read_resource(self._resource_offset(cluster, resource))
+
+    def get_resources(self, locations: Iterable[tuple[int, int]]) -> list[bytes]:
+        """Get the resources belonging to the given cluster/resource pairs, in the same order.
+
+        Resources that are adjacent in the resource file are read using a single read, without the read cache.
+        """
+        return self._read_resources([self._resource_offset(cluster, resource) for cluster, resource in locations])
 
 
 class SmallFileBlockResource(ResourceFile):
-    def parse_address(self, address: int) -> tuple[int, int]:
+    def __init__(
+        self,
+        vmfs: VMFS,
+        resource_type: ResourceType,
+        address: int,
+        fh: BinaryIO,
+        data: ResourceFileData | None = None,
+    ):
+        super().__init__(vmfs, resource_type, address, fh, data)
+        # The VMFS version doesn't change, so pick the address decoding once
         if self.vmfs.is_vmfs5:
-            block = parse_fb_address(self.vmfs, address)
-            return divmod(block, self.metadata.resourcePerCluster)
+            self.parse_address = self._parse_address_vmfs5
+            self._address_offset = self._address_offset_vmfs5
+        elif self.vmfs.is_vmfs6:
+            self.parse_address = self._parse_address_vmfs6
+        else:
+            raise ValueError("Unknown VMFS version")
+
+    def _parse_address_vmfs5(self, address: int) -> tuple[int, int]:
+        return divmod(parse_fb_address(self.vmfs, address), self._resource_per_cluster)
 
-        if self.vmfs.is_vmfs6:
-            return parse_sfb_address(self.vmfs, address)
+    def _parse_address_vmfs6(self, address: int) -> tuple[int, int]:
+        return parse_sfb_address(self.vmfs, address)
 
-        raise ValueError("Unknown VMFS version")
+    def _address_offset_vmfs5(self, address: int) -> int:
+        return self._block_offset(parse_fb_address(self.vmfs, address))
 
 
 class SubBlockResource(ResourceFile):
-    def parse_address(self, address: int) -> tuple[int, int]:
-        return parse_sb_address(self.vmfs, address)
+    def __init__(
+        self,
+        vmfs: VMFS,
+        resource_type: ResourceType,
+        address: int,
+        fh: BinaryIO,
+        data: ResourceFileData | None = None,
+    ):
+        super().__init__(vmfs, resource_type, address, fh, data)
+        # The VMFS version and descriptor config don't change, so pick the address decoding once
+        if self.vmfs.is_vmfs5:
+            if self.vmfs._config & 4:
+                self.parse_address = _parse_sb_address_vmfs5_extended
+            else:
+                self.parse_address = _parse_sb_address_vmfs5
+        else:
+            self.parse_address = _parse_sb_address_vmfs6
 
 
 class PointerBlockResource(ResourceFile):
-    def parse_address(self, address: int) -> tuple[int, int]:
-        return parse_pb_address(self.vmfs, address)
+    def __init__(
+        self,
+        vmfs: VMFS,
+        resource_type: ResourceType,
+        address: int,
+        fh: BinaryIO,
+        data: ResourceFileData | None = None,
+    ):
+        super().__init__(vmfs, resource_type, address, fh, data)
+        # The VMFS version doesn't change, so pick the address decoding once
+        self.parse_address = _parse_pb_address_vmfs5 if self.vmfs.is_vmfs5 else _parse_pb_address_vmfs6
 
 
 class FileDescriptorResource(ResourceFile):
@@ -404,15 +720,18 @@ class JournalBlockResource(ResourceFile):
 class LargeFileBlockResource(ResourceFile):
     def parse_address(self, address: int) -> tuple[int, int]:
         block = parse_lfb_address(self.vmfs, address)
-        return divmod(block, self.metadata.resourcePerCluster)
+        return divmod(block, self._resource_per_cluster)
+
+    def _address_offset(self, address: int) -> int:
+        return self._block_offset(parse_lfb_address(self.vmfs, address))
 
 
 RESOURCE_TYPE_MAP = {
-    ResourceType.FB: SmallFileBlockResource,
-    ResourceType.SB: SubBlockResource,
-    ResourceType.PB: PointerBlockResource,
-    ResourceType.FD: FileDescriptorResource,
-    ResourceType.PB2: PointerBlockResource,
-    ResourceType.JB: JournalBlockResource,
-    ResourceType.LFB: LargeFileBlockResource,
+    _FB: SmallFileBlockResource,
+    _SB: SubBlockResource,
+    _PB: PointerBlockResource,
+    _FD: FileDescriptorResource,
+    _PB2: PointerBlockResource,
+    _JB: JournalBlockResource,
+    _LFB: LargeFileBlockResource,
 }
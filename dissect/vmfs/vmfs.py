@@ -13,6 +13,7 @@ from dissect.util import ts
 from dissect.util.stream import AlignedStream
 
 from dissect.vmfs.c_vmfs import (
+    ADDRESS_TYPE_MASK,
     FileType,
     ResourceType,
     bsf,
@@ -31,15 +32,17 @@ from dissect.vmfs.resource import (
     address_fmt,
     address_tbz,
     address_type,
-    parse_fb_address,
-    parse_lfb_address,
-    parse_sfb_address,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
     from datetime import datetime
 
+# Default maximum number of file descriptors cached per VMFS instance
+FD_CACHE_SIZE = 16384
+
+_FD_TYPE = int(ResourceType.FD)
+
 
 class VMFS:
     """VMFS filesystem implementation.
@@ -71,6 +74,9 @@ class VMFS:
         pbc: BinaryIO | None = None,
         pb2: BinaryIO | None = None,
         jbc: BinaryIO | None = None,
+        fd_cache_size: int | None = None,
+        resource_preload_limit: int | None = None,
+        resource_cache_size: int | None = None,
     ):
         self.fh = volume
 
@@ -87,6 +93,9 @@ class VMFS:
             raise InvalidHeader("Invalid FS3 descriptor")
 
         self.block_size = self.descriptor.fileBlockSize
+        # Descriptor fields that are used often, copied to plain attributes for cheaper access
+        self._md_alignment = self.descriptor.mdAlignment
+        self._config = self.descriptor.config
         # Shifting by block_offset_shift is the same as multiplying by block_size
         self._block_offset_shift = bsf(self.block_size)
 
@@ -94,9 +103,12 @@ class VMFS:
         # VMFS5 = (0x0E, 0x51)
         self.major_version = self.descriptor.majorVersion
         self.minor_version = self.descriptor.minorVersion
+        # These are checked in a lot of places, so determine them once
+        self.is_vmfs5 = self.major_version <= 0x17
+        self.is_vmfs6 = self.major_version > 0x17
 
         self.uuid = vmfs_uuid(self.descriptor.uuid)
-        self.label = self.descriptor.fsLabel.split(b"\x00")[0].decode("utf-8")
+        self.label = self.descriptor.fsLabel.partition(b"\x00")[0].decode("utf-8")
 
         # Initialize some version specific variables
         if self.is_vmfs5:
@@ -110,8 +122,9 @@ class VMFS:
             self._fd_block_count = 256
             self._fd_block_data_size = 1024
 
-            # Size of a pointer block
+            # Size of a pointer block, and the shift that multiplies or divides by it
             self._pb_size = 0x400
+            self._pb_index_shift = 10
         else:
             # Heartbeat region size, needed for calculating the initial offset of the FDC
             hb_entry_size = c_vmfs.VMFS6_HB_ENTRY_SIZE
@@ -124,35 +137,37 @@ class VMFS:
             # and a resource. The cluster needs to be multiplied by the number of blocks
             # per cluster to get the real block number.
             self._sfb_cluster_size = 0x2000
-            if 0x20000000 // self.descriptor.fileBlockSize <= 0x2000:
-                self._sfb_cluster_size = 0x20000000 // self.descriptor.fileBlockSize
+            if 0x20000000 // self.block_size <= 0x2000:
+                self._sfb_cluster_size = 0x20000000 // self.block_size
 
             # Sizes related to file descriptors and their contents
-            self._fd_size = 2 * self.descriptor.mdAlignment
-            self._fd_resident_size = self.descriptor.mdAlignment - 0x200
+            self._fd_size = 2 * self._md_alignment
+            self._fd_resident_size = self._md_alignment - 0x200
 
-            if self.descriptor.mdAlignment < 0x1001:
+            if self._md_alignment < 0x1001:
                 self._fd_block_count = 320
                 self._fd_block_data_size = 2560
             else:
-                self._fd_block_count = self.descriptor.mdAlignment >> 4
-                self._fd_block_data_size = self.descriptor.mdAlignment >> 1
+                self._fd_block_count = self._md_alignment >> 4
+                self._fd_block_data_size = self._md_alignment >> 1
 
-            # Size of a pointer block
-            if self.descriptor.mdAlignment <= 0x10000:
+            # Size of a pointer block, and the shift that multiplies or divides by it
+            if self._md_alignment <= 0x10000:
                 self._pb_size = 0x2000
+                self._pb_index_shift = 13
             else:
-                self._pb_size = self.descriptor.mdAlignment >> 3
-
-        # Shifting by the bsf of a value is the same as multiplying or dividing by that value
-        self._pb_index_shift = bsf(self._pb_size)
+                self._pb_size = self._md_alignment >> 3
+                self._pb_index_shift = bsf(self._pb_size)
 
         # Calculate relevant offsets in file descriptor buffers
         self._fd_small_data_offset = self._fd_size - self._fd_resident_size
         self._fd_block_data_offset = self._fd_size - self._fd_block_data_size
+        self._fd_descriptor_offset = self._md_alignment or c_vmfs.VMFS5_MD_ALIGNMENT
+        # The block array is unpacked in a single call, so only build the struct once
+        self._fd_block_struct = struct.Struct(f"<{self._fd_block_count}{'I' if self.is_vmfs5 else 'Q'}")
 
         # Calculate the large file block (LFB) block size and offset shift
-        self._lfb_block_size = self.descriptor.fileBlockSize << self.descriptor.sfbToLfbShift
+        self._lfb_block_size = self.block_size << self.descriptor.sfbToLfbShift
         self._lfb_offset_shift = self._block_offset_shift + self.descriptor.sfbToLfbShift
 
         # While we're careful in the order we open resources, it's still possible that
@@ -160,7 +175,7 @@ class VMFS:
         # Right now there's too many dependencies on other resource files to make this work.
         # VMFS seems to get around this by sometimes using hardcoded values if a filesystem
         # object isn't available.
-        self.resources = ResourceManager(self)
+        self.resources = ResourceManager(self, resource_preload_limit, resource_cache_size)
 
         if fdc:
             self.resources.open(ResourceType.FD, fileobj=fdc)
@@ -171,7 +186,10 @@ class VMFS:
             self.fh.seek(fdc_base * self.block_size)
             self.resources.open(ResourceType.FD, fileobj=BytesIO(self.fh.read(self.block_size)))
 
-        self.file_descriptor = lru_cache(4096)(self.file_descriptor)
+        # The same address can be referenced with different names (e.g. . and ..), so that's part of the key
+        self._fd_cache: dict[tuple[int, str | None, int | None], FileDescriptor] = {}
+        self._fd_cache_size = FD_CACHE_SIZE if fd_cache_size is None else fd_cache_size
+        self._lookup = lru_cache(4096)(self._lookup)
 
         # Open the root directory
         self.root = self.file_descriptor(c_vmfs.ROOT_DIR_DESC_ADDR, "/")
@@ -182,18 +200,12 @@ class VMFS:
         # .pb2.sf - pointer block 2.system file
         # Contains the pointer blocks, used for indirect block referencing.
         # These eventually point to offsets on disk.
-        if pb2:
-            self.resources.open(ResourceType.PB2, fileobj=pb2)
-        else:
-            self.resources.open(ResourceType.PB2, address=c_vmfs.PB2_DESC_ADDR)
+        self.resources.open(ResourceType.PB2, address=c_vmfs.PB2_DESC_ADDR, fileobj=pb2)
 
         # .pbc.sf - pointer block cluster.system file
         # Also contains the pointer blocks, used for indirect block referencing. But different.
         # These eventually point to offsets on disk.
-        if pbc:
-            self.resources.open(ResourceType.PB, fileobj=pbc)
-        else:
-            self.resources.open(ResourceType.PB, address=c_vmfs.PBC_DESC_ADDR)
+        self.resources.open(ResourceType.PB, address=c_vmfs.PBC_DESC_ADDR, fileobj=pbc)
 
         # This is normally hardcoded to a specific value based on a global configuration
         # However, it turns out that this is the same as the resource size of the PBC resource
@@ -206,19 +218,12 @@ class VMFS:
 
         # .sbc.sf - sub-block cluster.system file
         # Contains sub-block/small-block data. Small file data is in here.
-        if sbc:
-            self.resources.open(ResourceType.SB, fileobj=sbc)
-        else:
-            self.resources.open(ResourceType.SB, address=c_vmfs.SB_DESC_ADDR)
+        self.resources.open(ResourceType.SB, address=c_vmfs.SB_DESC_ADDR, fileobj=sbc)
 
         # .fbb.sf - file block bitmap.system file
         # Contains allocation information etc. for file blocks.
-        if fbb:
-            self.resources.open(ResourceType.LFB, fileobj=fbb)
-            self.resources.open(ResourceType.FB, fileobj=fbb)
-        else:
-            self.resources.open(ResourceType.LFB, address=c_vmfs.FBB_DESC_ADDR)
-            self.resources.open(ResourceType.FB, address=c_vmfs.FBB_DESC_ADDR)
+        self.resources.open(ResourceType.LFB, address=c_vmfs.FBB_DESC_ADDR, fileobj=fbb)
+        self.resources.open(ResourceType.FB, address=c_vmfs.FBB_DESC_ADDR, fileobj=fbb)
 
         # .fdc.sf -  file descriptor cluster.system file
         # Contains all the file descriptors and their heartbeat/lock information.
@@ -235,18 +240,7 @@ class VMFS:
 
         # .jbc.sf - journal block cluster.system file
         # 0x2000004
-        if jbc:
-            self.resources.open(ResourceType.JB, fileobj=jbc)
-        else:
-            self.resources.open(ResourceType.JB, address=c_vmfs.JB_DESC_ADDR)
-
-    @property
-    def is_vmfs5(self) -> bool:
-        return self.major_version <= 0x17
-
-    @property
-    def is_vmfs6(self) -> bool:
-        return self.major_version > 0x17
+        self.resources.open(ResourceType.JB, address=c_vmfs.JB_DESC_ADDR, fileobj=jbc)
 
     def get(self, path: str | int, node: FileDescriptor | None = None) -> FileDescriptor:
         if isinstance(path, int):
@@ -254,25 +248,33 @@ class VMFS:
 
         node = node if node else self.root
 
-        parts = path.split("/")
-        for p in parts:
-            if not p:
-                continue
+        if (result := self._lookup(path, node)) is None:
+            raise FileNotFoundError(f"File not found: {path}")
+        return result
 
-            for child in node.iterdir():
-                if child.name == p:
-                    node = child
-                    break
-            else:
-                raise FileNotFoundError(f"File not found: {path}")
+    def _lookup(self, path: str, node: FileDescriptor) -> FileDescriptor | None:
+        """Resolve a path relative to the given node, or return ``None`` if it doesn't exist.
+
+        Results are cached, including those of paths that don't exist.
+        """
+        for p in _split_path(path):
+            if (node := node._listdir.get(p)) is None:
+                return None
 
         return node
 
     def file_descriptor(self, address: int, name: str | None = None, filetype: int | None = None) -> FileDescriptor:
-        if address_type(address) != ResourceType.FD:
+        # Same as address_type(address) != ResourceType.FD, but this is called for every directory entry
+        if address & ADDRESS_TYPE_MASK != _FD_TYPE:
             raise TypeError(f"Invalid block type: {address_fmt(self, address)}")
 
-        return FileDescriptor(self, address, name, filetype)
+        key = (address, name, filetype)
+        if (fd := self._fd_cache.get(key)) is None:
+            if self._fd_cache and len(self._fd_cache) >= self._fd_cache_size:
+                # Dicts are ordered, so this evicts the oldest entry
+                del self._fd_cache[next(iter(self._fd_cache))]
+            fd = self._fd_cache[key] = FileDescriptor(self, address, name, filetype)
+        return fd
 
     def iter_fd(self) -> Iterator[FileDescriptor]:
         for cluster, resource in self.resources.fdc.iter_resource_locations():
@@ -310,10 +312,6 @@ class FileDescriptor:
         self.name = name
         self._type = filetype
 
-        self._buf = None
-        self._lock_info = None
-        self._desc = None
-
     def __repr__(self) -> str:
         return f"<FileDescriptor address={address_fmt(self.vmfs, self.address)} name={self.name}>"
 
@@ -330,8 +328,7 @@ class FileDescriptor:
     @cached_property
     def descriptor(self) -> c_vmfs.FS3_FileDescriptor:
         """The parsed file descriptor struct for this file descriptor."""
-        desc_offset = self.vmfs.descriptor.mdAlignment or c_vmfs.VMFS5_MD_ALIGNMENT
-        return c_vmfs.FS3_FileDescriptor(self.raw[desc_offset:])
+        return c_vmfs.FS3_FileDescriptor(self.raw[self.vmfs._fd_descriptor_offset :])
 
     @property
     def parent(self) -> FileDescriptor | None:
@@ -373,9 +370,7 @@ class FileDescriptor:
     @cached_property
     def blocks(self) -> list[int]:
         """The block array of this file."""
-        block_buf = self.raw[self.vmfs._fd_block_data_offset :]
-        ctype = c_vmfs.uint32 if self.vmfs.is_vmfs5 else c_vmfs.uint64
-        return ctype[self.vmfs._fd_block_count](block_buf)
+        return list(self.vmfs._fd_block_struct.unpack_from(self.raw, self.vmfs._fd_block_data_offset))
 
     @cached_property
     def atime(self) -> datetime:
@@ -421,7 +416,16 @@ class FileDescriptor:
         return self.type == FileType.RDM
 
     def listdir(self) -> dict[str, FileDescriptor]:
-        """A dictionary of the content of this directory, if this file is a directory."""
+        """A dictionary of the content of this directory, if this file is a directory.
+
+        If a name occurs more than once, the last entry with that name is used.
+        """
+        # Return a copy, so callers can't modify the cached entries used for path lookups
+        return dict(self._listdir)
+
+    @cached_property
+    def _listdir(self) -> dict[str, FileDescriptor]:
+        # Directory content is parsed only once per file descriptor, which are themselves cached
         return {n.name: n for n in self.iterdir()}
 
     def iterdir(self) -> Iterator[FileDescriptor]:
@@ -438,12 +442,12 @@ class FileDescriptor:
         buf = self.open()
 
         num_entries = self.size // c_vmfs.VMFS5_DIR_ENTRY_SIZE
-        for _ in range(num_entries):
-            dirent = c_vmfs.FS3_DirEntry(buf)
-            if dirent.address == 0:
+        data = buf.read(num_entries * c_vmfs.VMFS5_DIR_ENTRY_SIZE)
+        for type_, address, _, name in _unpack_entries(_FS3_DIR_ENTRY, data, num_entries):
+            if address == 0:
                 continue
 
-            yield self.vmfs.file_descriptor(dirent.address, dirent.name.split(b"\x00")[0].decode(), dirent.type)
+            yield self.vmfs.file_descriptor(address, name.partition(b"\x00")[0].decode(), type_)
 
     def _iterdir_vmfs6(self) -> Iterator[FileDescriptor]:
         # Directories in VMFS6 are a bit more complex.
@@ -458,19 +462,21 @@ class FileDescriptor:
             raise NotADirectoryError(f"Invalid directory version for {self}: 0x{header.version:x}")
 
         block_base = c_vmfs.VMFS6_DIR_BLOCK_BASE
-        block_size = self.vmfs.descriptor.mdAlignment
+        block_size = self.vmfs._md_alignment
         entry_size = c_vmfs.VMFS6_DIR_ENTRY_SIZE
         entries_per_block = block_size // entry_size
 
         # . and .. are stored in the header
         if header.selfEntry.address != 0:
             yield self.vmfs.file_descriptor(
-                header.selfEntry.address, header.selfEntry.name.split(b"\x00")[0].decode(), header.selfEntry.type
+                header.selfEntry.address, header.selfEntry.name.partition(b"\x00")[0].decode(), header.selfEntry.type
             )
 
         if header.parentEntry.address != 0:
             yield self.vmfs.file_descriptor(
-                header.parentEntry.address, header.parentEntry.name.split(b"\x00")[0].decode(), header.parentEntry.type
+                header.parentEntry.address,
+                header.parentEntry.name.partition(b"\x00")[0].decode(),
+                header.parentEntry.type,
             )
 
         num_blocks = ((self.size - block_base) + (block_size - 1)) // block_size
@@ -479,21 +485,21 @@ class FileDescriptor:
             buf.seek(block_offset)
 
             # NOTE: Don't really know how this works yet, for now just do what vmfs-tool does
-            block_header = buf.read(0x40)
-
+            # The block header is 0x40 bytes, but only the first 4 bytes determine the block type
             # 0x30000 = block heartbeat bitmap
             # 0x20001 = hash table?
             # 0x10001 = directory entries
-            if block_header[:4] != b"\x01\x00\x01\x00":
+            if buf.read(4) != b"\x01\x00\x01\x00":
                 continue
 
-            for _ in range(entries_per_block):
-                dirent = c_vmfs.FS6_DirEntry(buf)
-                if dirent.address == 0:
+            buf.seek(block_offset + 0x40)
+            data = buf.read(entries_per_block * entry_size)
+            for type_, address, _, _, _, name, _ in _unpack_entries(_FS6_DIR_ENTRY, data, entries_per_block):
+                if address == 0:
                     # Deleted entries are zero'd
                     continue
 
-                yield self.vmfs.file_descriptor(dirent.address, dirent.name.split(b"\x00")[0].decode(), dirent.type)
+                yield self.vmfs.file_descriptor(address, name.partition(b"\x00")[0].decode(), type_)
 
     def open(self) -> BytesIO | BlockStream:
         """Open this file and return a new file-like object."""
@@ -537,46 +543,66 @@ class BlockStream(AlignedStream):
             self.vmfs5_extension = False
         self.zla = ResourceType(zla)
 
+        # Copy the volume geometry that's needed for every block read
+        self._is_vmfs5 = self.vmfs.is_vmfs5
+        self._pb_index_shift = self.vmfs._pb_index_shift
+        self._pb_index_mask = (1 << self.vmfs._pb_index_shift) - 1
+        self._volume_block_shift = self.vmfs._block_offset_shift
+        self._sfb_cluster_size = self.vmfs._sfb_cluster_size if self.vmfs.is_vmfs6 else None
+        self._lfb_block_size = self.vmfs._lfb_block_size
+        self._lfb_offset_shift = self.vmfs._lfb_offset_shift
+
         super().__init__(self.descriptor.size)
 
     def _offset_to_block(self, offset: int) -> int:
         idx = offset >> self.block_offset_shift
-        if self.zla in (ResourceType.FB, ResourceType.SB):
+        zla = self.zla
+        if zla in (ResourceType.FB, ResourceType.SB):
             return self.blocks[idx]
 
-        if self.zla == ResourceType.PB:
+        # This is the innermost loop of every read, so look everything up only once
+        blocks = self.blocks
+        pb_shift = self._pb_index_shift
+        pb_mask = self._pb_index_mask
+
+        if zla == ResourceType.PB:
             # This is equivalent to divmod(idx, addressesPerPb)
-            if self.vmfs.is_vmfs5:
+            if self._is_vmfs5:
+                pbc = self.vmfs.resources.pbc
                 # Don't think this really means "vmfs5_extension"
                 if self.vmfs5_extension:
                     # Double indirection
-                    primary_idx = idx >> (2 * self.vmfs._pb_index_shift)
-                    secondary_idx = (idx >> self.vmfs._pb_index_shift) & ((1 << self.vmfs._pb_index_shift) - 1)
-                    tertiary_idx = idx & ((1 << self.vmfs._pb_index_shift) - 1)
+                    primary_idx = idx >> (2 * pb_shift)
+                    secondary_idx = (idx >> pb_shift) & pb_mask
+                    tertiary_idx = idx & pb_mask
 
-                    primary_block = self.blocks[primary_idx]
-                    primary_pb_buf = self.vmfs.resources.pbc.get(primary_block)
+                    primary_block = blocks[primary_idx]
+                    primary_pb_buf = pbc.get(primary_block)
 
                     secondary_block = _get_uint32_index(primary_pb_buf, secondary_idx)
-                    secondary_pb_buf = self.vmfs.resources.pbc.get(secondary_block)
+                    secondary_pb_buf = pbc.get(secondary_block)
 
                     return _get_uint32_index(secondary_pb_buf, tertiary_idx)
                 # Single indirection
-                primary_idx = (idx >> self.vmfs._pb_index_shift) & ((1 << self.vmfs._pb_index_shift) - 1)
-                secondary_idx = idx & ((1 << self.vmfs._pb_index_shift) - 1)
+                primary_idx = (idx >> pb_shift) & pb_mask
+                secondary_idx = idx & pb_mask
 
-                primary_block = self.blocks[primary_idx]
-                primary_pb_buf = self.vmfs.resources.pbc.get(primary_block)
+                primary_block = blocks[primary_idx]
+                primary_pb_buf = pbc.get(primary_block)
 
                 return _get_uint32_index(primary_pb_buf, secondary_idx)
+
+            sbc = self.vmfs.resources.sbc
+            # The PBC index shift is only known once the PBC is opened, which itself is read through a BlockStream
+            pbc_mask = (1 << self.vmfs._pbc_index_shift) - 1
             if self.vmfs5_extension:
                 # Double indirection
-                primary_idx = idx >> (2 * self.vmfs._pb_index_shift)
-                secondary_idx = (idx >> self.vmfs._pb_index_shift) & ((1 << self.vmfs._pbc_index_shift) - 1)
-                tertiary_idx = idx & ((1 << self.vmfs._pbc_index_shift) - 1)
+                primary_idx = idx >> (2 * pb_shift)
+                secondary_idx = (idx >> pb_shift) & pbc_mask
+                tertiary_idx = idx & pbc_mask
 
-                primary_block = self.blocks[primary_idx]
-                primary_pb_buf = self.vmfs.resources.sbc.get(primary_block)
+                primary_block = blocks[primary_idx]
+                primary_pb_buf = sbc.get(primary_block)
 
                 # NOTE: can become LFB here?
                 secondary_block = _get_uint64_index(primary_pb_buf, secondary_idx)
@@ -584,92 +610,150 @@ class BlockStream(AlignedStream):
                 if address_type(secondary_block) == ResourceType.LFB:
                     return secondary_block
 
-                secondary_pb_buf = self.vmfs.resources.sbc.get(secondary_block)
+                secondary_pb_buf = sbc.get(secondary_block)
 
                 # NOTE: there are some flags that can influence the final index
                 # NOTE: can become LFB here?
                 return _get_uint64_index(secondary_pb_buf, tertiary_idx)
             # Single indirection
-            primary_idx = idx >> self.vmfs._pb_index_shift
-            secondary_idx = idx & ((1 << self.vmfs._pbc_index_shift) - 1)
+            primary_idx = idx >> pb_shift
+            secondary_idx = idx & pbc_mask
 
             # NOTE: can become LFB here?
-            primary_block = self.blocks[primary_idx]
+            primary_block = blocks[primary_idx]
 
             if address_type(primary_block) == ResourceType.LFB:
                 return primary_block
 
-            primary_pb_buf = self.vmfs.resources.sbc.get(primary_block)
+            primary_pb_buf = sbc.get(primary_block)
 
             # NOTE: there are some flags that can influence the final index
             # NOTE: can become LFB here?
             return _get_uint64_index(primary_pb_buf, secondary_idx)
 
-        if self.zla == ResourceType.PB2:
+        if zla == ResourceType.PB2:
             # This is equivalent to divmod(idx, addressesPerPb2)
-            primary_idx = idx >> (2 * self.vmfs._pb_index_shift)
-            secondary_idx = idx & ((1 << self.vmfs._pb_index_shift) - 1)
+            primary_idx = idx >> (2 * pb_shift)
+            secondary_idx = idx & pb_mask
 
-            primary_block = self.blocks[primary_idx]
+            primary_block = blocks[primary_idx]
             primary_pb_buf = self.vmfs.resources.pb2.get(primary_block)
 
-            if self.vmfs.is_vmfs5:
+            if self._is_vmfs5:
                 return _get_uint32_index(primary_pb_buf, secondary_idx)
             return _get_uint64_index(primary_pb_buf, secondary_idx)
         raise ValueError(f"Unexpected ZLA in {self.descriptor}: {self.zla}")
 
+    def _read_block_none(self, block_address: int, offset: int, length: int) -> tuple[int, int | None, bytes | None]:
+        # The read buffer is zero initialized, so there's nothing to read
+        _, read_length = _read_offset_and_length(offset, length, self.block_size)
+        return read_length, None, None
+
+    def _read_block_fb(self, block_address: int, offset: int, length: int) -> tuple[int, int | None, bytes | None]:
+        # The address parsing is inlined here, see parse_fb_address and parse_sfb_address
+        if self._sfb_cluster_size is None:
+            block_num = (block_address & 0xFFFFFFC0) >> 6
+        else:
+            cluster = (block_address & 0x00003FFFFFFF8000) >> 15
+            resource = (block_address & 0xFFF8000000000000) >> 51
+            block_num = self._sfb_cluster_size * cluster + resource
+        block_offset = block_num << self._volume_block_shift
+
+        read_offset, read_length = _read_offset_and_length(offset, length, self.block_size)
+        return read_length, block_offset + read_offset, None
+
+    def _read_block_sb(self, block_address: int, offset: int, length: int) -> tuple[int, int | None, bytes | None]:
+        read_offset, read_length = _read_offset_and_length(offset, length, self.vmfs.resources.sbc.resource_size)
+
+        block_buf = self.vmfs.resources.sbc.get(block_address)
+        return read_length, None, block_buf[read_offset : read_offset + read_length]
+
+    def _read_block_lfb(self, block_address: int, offset: int, length: int) -> tuple[int, int | None, bytes | None]:
+        # The address parsing is inlined here, see parse_lfb_address
+        block_num = (block_address & 0x3FFFFFFF8000) >> 15
+        read_offset, read_length = _read_offset_and_length(offset, length, self._lfb_block_size)
+        return read_length, (block_num << self._lfb_offset_shift) + read_offset, None
+
+    def _read_block_invalid(self, block_address: int, offset: int, length: int) -> tuple[int, int | None, bytes | None]:
+        raise ValueError(
+            f"Unexpected block type while reading {self.descriptor}: {address_fmt(self.vmfs, block_address)}"
+        )
+
+    # Block readers indexed by block type, they return the read length and an offset on the volume or the data, if any
+    _block_readers = (
+        _read_block_none,
+        _read_block_fb,
+        _read_block_sb,
+        _read_block_invalid,
+        _read_block_invalid,
+        _read_block_invalid,
+        _read_block_invalid,
+        _read_block_lfb,
+    )
+
     def _read(self, offset: int, length: int) -> bytes:
-        r = []
+        result = bytearray(length)
+        view = memoryview(result)
+        pos = 0
+        # FB and LFB blocks that are also consecutive on the volume are read using a single read
+        run_offset = run_pos = run_length = 0
+
         while length > 0:
             block_address = self._offset_to_block(offset)
-            block_type = address_type(block_address)
+            block_type = 0 if address_tbz(self.vmfs, block_address) else address_type(block_address)
 
-            if address_tbz(self.vmfs, block_address):
-                block_type = 0
+            read_length, volume_offset, buf = self._block_readers[block_type](self, block_address, offset, length)
 
-            read_offset = None
-            read_length = None
-
-            if block_type == ResourceType.NONE:
-                _, read_length = _read_offset_and_length(offset, length, self.block_size)
-                r.append(b"\x00" * read_length)
+            if volume_offset is not None and run_length and run_offset + run_length == volume_offset:
+                run_length += read_length
+            else:
+                if run_length:
+                    if (n := self._read_volume(view[run_pos : run_pos + run_length], run_offset)) < run_length:
+                        # Short read at the end of the volume, return what we have instead of zero padding
+                        return bytes(result[: run_pos + n])
+                    run_length = 0
+
+                if volume_offset is not None:
+                    run_offset, run_pos, run_length = volume_offset, pos, read_length
+                elif buf is not None:
+                    view[pos : pos + len(buf)] = buf
+
+            pos += read_length
+            length -= read_length
+            offset += read_length
 
-            elif block_type == ResourceType.FB:
-                if self.vmfs.is_vmfs5:
-                    block_num = parse_fb_address(self.vmfs, block_address)
-                else:
-                    cluster, resource = parse_sfb_address(self.vmfs, block_address)
-                    block_num = self.vmfs._sfb_cluster_size * cluster + resource
-                block_offset = block_num << self.vmfs._block_offset_shift
+        if run_length and (n := self._read_volume(view[run_pos : run_pos + run_length], run_offset)) < run_length:
+            return bytes(result[: run_pos + n])
 
-                read_offset, read_length = _read_offset_and_length(offset, length, self.block_size)
-                self.vmfs.fh.seek(block_offset + read_offset)
-                r.append(self.vmfs.fh.read(read_length))
+        return bytes(result)
 
-            elif block_type == ResourceType.SB:
-                read_offset, read_length = _read_offset_and_length(
-                    offset, length, self.vmfs.resources.sbc.resource_size
-                )
+    def _read_volume(self, view: memoryview, offset: int) -> int:
+        """Read from the volume at the given offset into the given buffer, returning the number of bytes read."""
+        fh = self.vmfs.fh
+        fh.seek(offset)
+        if (readinto := getattr(fh, "readinto", None)) is not None:
+            return readinto(view) or 0
 
-                block_buf = self.vmfs.resources.sbc.get(block_address)
-                r.append(block_buf[read_offset : read_offset + read_length])
+        buf = fh.read(len(view))
+        view[: len(buf)] = buf
+        return len(buf)
 
-            elif block_type == ResourceType.LFB:
-                block_num = parse_lfb_address(self.vmfs, block_address)
-                read_offset, read_length = _read_offset_and_length(offset, length, self.vmfs._lfb_block_size)
 
-                self.vmfs.fh.seek((block_num << self.vmfs._lfb_offset_shift) + read_offset)
-                r.append(self.vmfs.fh.read(read_length))
+@lru_cache(1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a path into its non-empty components."""
+    return tuple(p for p in path.split("/") if p)
 
-            else:
-                raise ValueError(
-                    f"Unexpected block type while reading {self.descriptor}: {address_fmt(self.vmfs, block_address)}"
-                )
 
-            length -= read_length
-            offset += read_length
+def _unpack_entries(entry: struct.Struct, data: bytes, count: int) -> Iterator[tuple]:
+    """Unpack ``count`` consecutive entries from ``data``.
 
-        return b"".join(r)
+    Raises ``EOFError`` after the last complete entry if ``data`` is too short, like parsing them with cstruct does.
+    """
+    size = len(data) - (len(data) % entry.size)
+    yield from entry.iter_unpack(memoryview(data)[:size])
+    if size < count * entry.size:
+        raise EOFError(f"Expected {count} entries of {entry.size} bytes, got {len(data)} bytes")
 
 
 def _read_offset_and_length(offset: int, length: int, block_size: int) -> tuple[int, int]:
@@ -681,11 +765,19 @@ def _read_offset_and_length(offset: int, length: int, block_size: int) -> tuple[
     return offset_in_block, read_length
 
 
+_UINT32 = struct.Struct("<I")
+_UINT64 = struct.Struct("<Q")
+
+# Same layouts as FS3_DirEntry and FS6_DirEntry, so directories can be unpacked in a single call
+_FS3_DIR_ENTRY = struct.Struct("<III128s")
+_FS6_DIR_ENTRY = struct.Struct("<IIIIQ256sQ")
+
+
 def _get_uint32_index(buf: bytes, index: int) -> int:
     """Convenience function to index into a uint32 sized array."""
-    return struct.unpack("<I", buf[index * 4 : (index * 4) + 4])[0]
+    return _UINT32.unpack_from(buf, index * 4)[0]
 
 
 def _get_uint64_index(buf: bytes, index: int) -> int:
     """Convenience function to index into a uint64 sized array."""
-    return struct.unpack("<Q", buf[index * 8 : (index * 8) + 8])[0]
+    return _UINT64.unpack_from(buf, index * 8)[0]
@@ -1,28 +1,51 @@
 from __future__ import annotations
 
 import gzip
+import io
+from functools import cache
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO
+from typing import BinaryIO
 
 import pytest
 
-if TYPE_CHECKING:
-    from collections.abc import Iterator
+from dissect.vmfs import lvm, vmfs
+
+VMFS5_IMAGE = "data/vmfs5.bin.gz"
+VMFS6_IMAGE = "data/vmfs6.bin.gz"
 
 
 def absolute_path(filename: str) -> Path:
     return Path(__file__).parent / filename
 
 
-@pytest.fixture
-def vmfs5() -> Iterator[BinaryIO]:
-    name = "data/vmfs5.bin.gz"
+@cache
+def read_gz(name: str) -> bytes:
+    """Decompress a test image once, repeated calls return the same bytes."""
     with gzip.GzipFile(absolute_path(name), "rb") as fh:
-        yield fh
+        return fh.read()
+
+
+def open_gz(name: str) -> BinaryIO:
+    """Open a test image as a fresh in-memory stream, so seek positions are never shared between tests."""
+    return io.BytesIO(read_gz(name))
 
 
 @pytest.fixture
-def vmfs6() -> Iterator[BinaryIO]:
-    name = "data/vmfs6.bin.gz"
-    with gzip.GzipFile(absolute_path(name), "rb") as fh:
-        yield fh
+def vmfs5() -> BinaryIO:
+    return open_gz(VMFS5_IMAGE)
+
+
+@pytest.fixture
+def vmfs6() -> BinaryIO:
+    return open_gz(VMFS6_IMAGE)
+
+
+# Opening a VMFS parses the volume header and all resource files, so share one instance per test module
+@pytest.fixture(scope="module")
+def fs5() -> vmfs.VMFS:
+    return vmfs.VMFS(lvm.LVM(open_gz(VMFS5_IMAGE)))
+
+
+@pytest.fixture(scope="module")
+def fs6() -> vmfs.VMFS:
+    return vmfs.VMFS(lvm.LVM(open_gz(VMFS6_IMAGE)))
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import io
+from types import SimpleNamespace
 from typing import BinaryIO
 
+import pytest
+
 from dissect.vmfs import lvm
+from dissect.vmfs.c_vmfs import vmfs_uuid
+
+PE_SIZE = lvm.VMFS_LVM_PE_SIZE
 
 
 def test_lvm5(vmfs5: BinaryIO) -> None:
@@ -35,3 +42,89 @@ def test_lvm6(vmfs6: BinaryIO) -> None:
     assert extent.num_pe == 3
     assert extent.first_pe == 0
     assert extent.last_pe == 2
+
+
+class PatternFile:
+    """Infinite file-like object where each byte is derived from its offset and a seed."""
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self.pos = 0
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self.pos = offset
+        return self.pos
+
+    def tell(self) -> int:
+        return self.pos
+
+    def read(self, length: int = -1) -> bytes:
+        buf = bytes((self.pos + i + self.seed) & 0xFF for i in range(length))
+        self.pos += length
+        return buf
+
+
+class FakeExtent(lvm.Extent):
+    def __init__(self, fh: BinaryIO, first_pe: int, num_pe: int, data_offset: int, volume_size: int):
+        self.fh = fh
+        self.metadata = SimpleNamespace(majorVersion=6, dataOffset=data_offset, volumeSize=num_pe * PE_SIZE)
+        self.volume_info = SimpleNamespace(size=volume_size)
+        self.uuid = "6113001e-95afd8fb-d830-000c29801686"
+        self.num_pe = num_pe
+        self.first_pe = first_pe
+        self.last_pe = first_pe + num_pe - 1
+        super(lvm.Extent, self).__init__(self.metadata.volumeSize)
+
+
+def read_extents(extents: list[lvm.Extent], offset: int, length: int) -> bytes:
+    # Reference implementation, reads through the extent streams themselves
+    r = []
+    for extent in sorted(extents, key=lambda e: e.first_pe):
+        start = extent.first_pe * PE_SIZE
+        if offset >= start + extent.size or offset + length <= start:
+            continue
+
+        read_start = max(offset, start)
+        read_end = min(offset + length, start + extent.size)
+        extent.seek(read_start - start)
+        r.append(extent.read(read_end - read_start))
+
+    return b"".join(r)
+
+
+def test_lvm_multiple_extents() -> None:
+    volume_size = 3 * PE_SIZE
+    extents = [
+        FakeExtent(PatternFile(2), 2, 1, 0, volume_size),
+        FakeExtent(PatternFile(0), 0, 1, 0x1000, volume_size),
+        FakeExtent(PatternFile(1), 1, 1, 0x200000, volume_size),
+    ]
+    vs = lvm.LVM(extents)
+
+    assert vs.size == volume_size
+    assert [extent.first_pe for extent in vs.extents] == [0, 1, 2]
+
+    for offset, length in [
+        # Within a single extent
+        (0, 0x1000),
+        (PE_SIZE + 0x100, 0x200),
+        # Across one extent boundary
+        (PE_SIZE - 0x123, 0x400),
+        (2 * PE_SIZE - 0x10, 0x20),
+        # Up to the end of the volume
+        (volume_size - 0x300, 0x300),
+    ]:
+        vs.seek(offset)
+        assert vs.read(length) == read_extents(extents, offset, length)
+
+
+@pytest.mark.parametrize("buf_type", [bytes, bytearray, memoryview])
+def test_vmfs_uuid(buf_type: type) -> None:
+    buf = bytes.fromhex("d57d1361107872d0c27a000c29801686")
+    assert vmfs_uuid(buf_type(buf)) == "61137dd5-d0727810-7ac2-000c29801686"
+
+
+@pytest.mark.parametrize("length", [0, 15, 17])
+def test_vmfs_uuid_invalid_length(length: int) -> None:
+    with pytest.raises(ValueError, match="Invalid VMFS UUID length"):
+        vmfs_uuid(b"\x00" * length)
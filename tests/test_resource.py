@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import io
+import struct
+from types import SimpleNamespace
+
+import pytest
+
+from dissect.vmfs.c_vmfs import ResourceType, c_vmfs
+from dissect.vmfs.resource import FileDescriptorResource
+
+# Res3_Metadata, up to and including parentClusterGroupSize
+RES3_METADATA = struct.Struct("<11I2H4I")
+
+
+def make_resource_file(
+    cluster_header_size: int, resource_per_cluster: int = 2
+) -> tuple[FileDescriptorResource, list[tuple[int, int]]]:
+    # A synthetic VMFS6 resource file with 4 byte resources, 2 resources per cluster and 2 clusters per cluster group
+    # The first cluster group starts directly after the metadata, and every byte in the file equals its offset
+    num_resources = 8
+    clusters_per_group = 2
+    resource_size = 4
+    cluster_group_size = clusters_per_group * (cluster_header_size + resource_per_cluster * resource_size)
+
+    metadata = RES3_METADATA.pack(
+        resource_per_cluster,
+        clusters_per_group,
+        RES3_METADATA.size,  # firstClusterGroupOffset
+        resource_size,
+        cluster_group_size,
+        num_resources,  # numResourcesLo
+        2,  # numClusterGroups
+        0,  # numResourcesHi
+        c_vmfs.VMFS_RESOURCE_META_SIGNATURE,
+        0,  # version
+        0,  # flags
+        *([0] * 6),
+    )
+    fh = io.BytesIO(metadata + bytes(range(len(metadata), 256)))
+
+    # Cluster headers are twice the metadata alignment on VMFS6
+    vmfs = SimpleNamespace(is_vmfs5=False, is_vmfs6=True, _md_alignment=cluster_header_size // 2)
+    resource = FileDescriptorResource(vmfs, ResourceType.FD, c_vmfs.FDBC_DESC_ADDR, fh)
+
+    reads = []
+    read = resource._read
+
+    def _read(offset: int, length: int) -> bytes:
+        reads.append((offset, length))
+        return read(offset, length)
+
+    resource._read = _read
+    return resource, reads
+
+
+def test_resource_file_metadata() -> None:
+    resource, _ = make_resource_file(4)
+
+    assert resource.resource_size == 4
+    assert resource.metadata.clusterGroupSize == 24
+    assert list(resource.iter_resource_locations()) == [(cluster, r) for cluster in range(4) for r in range(2)]
+
+
+def test_resource_file_inconsistent_metadata() -> None:
+    resource, _ = make_resource_file(4, resource_per_cluster=0)
+
+    with pytest.raises(ValueError, match="no resources per cluster"):
+        list(resource.iter_resource_locations())
+
+
+def test_read_resources_order() -> None:
+    # Each cluster group starts with 8 bytes of cluster headers, so groups are not adjacent to each other:
+    #   group 0: headers 64-71, cluster 0 at 72-79, cluster 1 at 80-87
+    #   group 1: headers 88-95, cluster 2 at 96-103, cluster 3 at 104-111
+    resource, reads = make_resource_file(4)
+
+    # Out of order, with a duplicate, crossing a cluster boundary (0, 1) -> (1, 0)
+    # and a cluster group boundary (1, 1) -> (2, 0)
+    locations = [(2, 0), (0, 1), (1, 0), (0, 1), (3, 1), (1, 1), (0, 0)]
+    offsets = [96, 76, 80, 76, 108, 84, 72]
+
+    assert resource.get_resources(locations) == [bytes(range(offset, offset + 4)) for offset in offsets]
+    # Cluster 0 and 1 are adjacent and read at once, the cluster group headers separate the other reads
+    assert reads == [(72, 16), (96, 4), (108, 4)]
+
+
+def test_read_resources_across_cluster_groups() -> None:
+    # Without cluster headers, the cluster groups are adjacent to each other:
+    #   group 0: cluster 0 at 64-71, cluster 1 at 72-79
+    #   group 1: cluster 2 at 80-87, cluster 3 at 88-95
+    resource, reads = make_resource_file(0)
+
+    locations = [(2, 0), (1, 1), (2, 1)]
+    offsets = [80, 76, 84]
+
+    assert resource.get_resources(locations) == [bytes(range(offset, offset + 4)) for offset in offsets]
+    # The last resource of group 0 and the first resources of group 1 are read at once
+    assert reads == [(76, 12)]
+
+
+def test_read_resources_empty() -> None:
+    resource, reads = make_resource_file(4)
+
+    assert resource.get_resources([]) == []
+    assert reads == []
+
+
+def test_read_resources_single() -> None:
+    resource, reads = make_resource_file(4)
+
+    assert resource.get_resources([(3, 0)]) == [bytes(range(104, 108))]
+    assert reads == [(104, 4)]
@@ -1,82 +1,188 @@
 from __future__ import annotations
 
+import gzip
 import io
+import struct
+from pathlib import Path
 from typing import BinaryIO
 
+import pytest
+
 from dissect.vmfs import lvm, vmfs
+from dissect.vmfs.c_vmfs import ResourceType, c_vmfs
+
+
+def test_vmfs5(fs5: vmfs.VMFS) -> None:
+    assert fs5.block_size == 0x100000
+    assert fs5.major_version == 0xE
+    assert fs5.minor_version == 0x51
+
+    assert fs5.uuid == "61137dd5-df6bc2c8-f0e7-000c29801686"
+    assert fs5.label == "VMFS5 Test"
+
+    assert fs5._fd_size == 0x800
+    assert fs5._fd_resident_size == 0x400
+    assert fs5._fd_block_count == 0x100
+    assert fs5._fd_block_data_size == 0x400
+    assert fs5._pb_size == 0x400
+    assert fs5._pb_index_shift == 10
+    assert fs5._fd_small_data_offset == 0x400
+    assert fs5._fd_block_data_offset == 0x400
+
+    assert fs5.resources.fdc.resource_size == 0x800
+    assert ResourceType.FD in fs5.resources
+    assert ResourceType.PB in fs5.resources
+
+    assert fs5.root.size == 0x578
+
+    verify_resources(fs5)
+    verify_fs_content(fs5)
+
+
+def test_vmfs6(fs6: vmfs.VMFS) -> None:
+    assert fs6.block_size == 0x100000
+    assert fs6.major_version == 0x18
+    assert fs6.minor_version == 0x52
+
+    assert fs6.uuid == "6113001e-a6377ebc-1d24-000c29801686"
+    assert fs6.label == "VMFS6 Test"
+
+    assert fs6._fd_size == 0x2000
+    assert fs6._fd_resident_size == 0xE00
+    assert fs6._fd_block_count == 0x140
+    assert fs6._fd_block_data_size == 0xA00
+    assert fs6._pb_size == 0x2000
+    assert fs6._pb_index_shift == 13
+    assert fs6._fd_small_data_offset == 0x1200
+    assert fs6._fd_block_data_offset == 0x1600
+    assert fs6._lfb_block_size == 0x20000000
+    assert fs6._lfb_offset_shift == 29
+
+    assert fs6.resources.fdc.resource_size == 0x2000
+    assert ResourceType.FD in fs6.resources
+    assert ResourceType.PB in fs6.resources
+
+    assert fs6.root.size == 0x12000
 
+    verify_resources(fs6)
+    verify_fs_content(fs6)
 
-def test_vmfs5(vmfs5: BinaryIO) -> None:
-    fh = lvm.LVM(vmfs5)
-    fs = vmfs.VMFS(fh)
 
-    assert fs.block_size == 0x100000
-    assert fs.major_version == 0xE
-    assert fs.minor_version == 0x51
+class ReadOnlyStream:
+    """Minimal file-like object without ``readinto``."""
 
-    assert fs.uuid == "61137dd5-df6bc2c8-f0e7-000c29801686"
-    assert fs.label == "VMFS5 Test"
+    def __init__(self, fh: BinaryIO):
+        self.fh = fh
 
-    assert fs._fd_size == 0x800
-    assert fs._fd_resident_size == 0x400
-    assert fs._fd_block_count == 0x100
-    assert fs._fd_block_data_size == 0x400
-    assert fs._pb_size == 0x400
-    assert fs._pb_index_shift == 10
-    assert fs._fd_small_data_offset == 0x400
-    assert fs._fd_block_data_offset == 0x400
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self.fh.seek(offset, whence)
 
-    assert fs.resources.fdc.resource_size == 0x800
+    def tell(self) -> int:
+        return self.fh.tell()
 
-    assert fs.root.size == 0x578
+    def read(self, length: int = -1) -> bytes:
+        return self.fh.read(length)
 
-    verify_fs_content(fs)
 
+@pytest.mark.parametrize("image", ["vmfs5", "vmfs6"])
+def test_vmfs_volume_without_readinto(image: str, request: pytest.FixtureRequest) -> None:
+    fs = vmfs.VMFS(ReadOnlyStream(lvm.LVM(request.getfixturevalue(image))))
 
-def test_vmfs6(vmfs6: BinaryIO) -> None:
-    fh = lvm.LVM(vmfs6)
-    fs = vmfs.VMFS(fh)
+    assert fs.get("directory/file4").open().read() == b"content\n"
+    assert fs.get("directory/file5").open().read() == (b"a" * 8192) + b"\n"
 
-    assert fs.block_size == 0x100000
-    assert fs.major_version == 0x18
-    assert fs.minor_version == 0x52
 
-    assert fs.uuid == "6113001e-a6377ebc-1d24-000c29801686"
-    assert fs.label == "VMFS6 Test"
+@pytest.mark.parametrize("volume", [io.BytesIO(b"abcd"), ReadOnlyStream(io.BytesIO(b"abcd"))])
+def test_block_stream_short_volume_read(vmfs5: BinaryIO, volume: BinaryIO) -> None:
+    fs = vmfs.VMFS(lvm.LVM(vmfs5))
+    stream = fs.get("directory/file5").open()
 
-    assert fs._fd_size == 0x2000
-    assert fs._fd_resident_size == 0xE00
-    assert fs._fd_block_count == 0x140
-    assert fs._fd_block_data_size == 0xA00
-    assert fs._pb_size == 0x2000
-    assert fs._pb_index_shift == 13
-    assert fs._fd_small_data_offset == 0x1200
-    assert fs._fd_block_data_offset == 0x1600
-    assert fs._lfb_block_size == 0x20000000
-    assert fs._lfb_offset_shift == 29
+    fs.fh = volume
+    buf = bytearray(8)
+    assert stream._read_volume(memoryview(buf), 1) == 3
+    assert buf == b"bcd" + b"\x00" * 5
 
-    assert fs.resources.fdc.resource_size == 0x2000
 
-    assert fs.root.size == 0x12000
+def test_vmfs_resource_from_gzip(fs5: vmfs.VMFS, vmfs5: BinaryIO, tmp_path: Path) -> None:
+    path = tmp_path / "fdc.sf.gz"
+    with gzip.open(path, "wb") as fh:
+        fh.write(fs5.get(".fdc.sf").open().read())
 
-    verify_fs_content(fs)
+    with gzip.open(path, "rb") as fdc:
+        # Don't preload the resource file, so resources are read from the gzip file object itself
+        fs = vmfs.VMFS(lvm.LVM(vmfs5), fdc=fdc, resource_preload_limit=0)
+        assert fs.get("directory/file4").open().read() == b"content\n"
+
+
+def test_vmfs_cache_limits(vmfs5: BinaryIO) -> None:
+    fs = vmfs.VMFS(lvm.LVM(vmfs5), fd_cache_size=2, resource_preload_limit=0, resource_cache_size=0)
+
+    assert fs.get("directory/file4").open().read() == b"content\n"
+    assert fs.get("directory/file5").open().read() == (b"a" * 8192) + b"\n"
+    assert len(fs._fd_cache) <= 2
+
+
+def test_unpack_entries() -> None:
+    entry = struct.Struct("<II")
+    data = entry.pack(1, 2) + entry.pack(3, 4)
+
+    assert list(vmfs._unpack_entries(entry, data, 2)) == [(1, 2), (3, 4)]
+
+    # Truncated data yields the complete entries before raising EOFError, like cstruct
+    entries = vmfs._unpack_entries(entry, data[:-1], 2)
+    assert next(entries) == (1, 2)
+    with pytest.raises(EOFError):
+        next(entries)
+
+    with pytest.raises(EOFError):
+        list(vmfs._unpack_entries(entry, b"", 1))
+
+
+def verify_resources(fs: vmfs.VMFS) -> None:
+    for resource in fs.resources.resources:
+        if resource is None:
+            continue
+
+        num_resources = (resource.metadata.numResourcesHi << 32) | resource.metadata.numResourcesLo
+        locations = list(resource.iter_resource_locations())
+        assert len(locations) == num_resources
+        assert len(set(locations)) == num_resources
 
 
 def verify_fs_content(fs: vmfs.VMFS) -> None:
     root_entries = fs.root.listdir()
 
-    assert ".fbb.sf" in root_entries
-    assert ".fdc.sf" in root_entries
-    assert ".vh.sf" in root_entries
-    assert "directory" in root_entries
+    assert {".fbb.sf", ".fdc.sf", ".vh.sf", "directory"} <= root_entries.keys()
     assert root_entries["directory"].is_dir()
 
     if fs.is_vmfs6:
         assert root_entries["directory"].parent.address == fs.root.address
 
+    # Modifying the result of listdir must not affect path lookups
+    root_entries.pop("directory")
+    assert "directory" not in root_entries
+    assert fs.get("directory").is_dir()
+    assert "directory" in fs.root.listdir()
+
     dir_entries = fs.get("directory").listdir()
 
-    assert set(dir_entries.keys()) == {
+    # Unsorted, with duplicates and with descriptors that are not adjacent in the FDC
+    addresses = [
+        dir_entries["file5"].address,
+        fs.root.address,
+        dir_entries["file1"].address,
+        dir_entries["file5"].address,
+        dir_entries["symlink"].address,
+        dir_entries["file3"].address,
+        fs.root.address,
+    ]
+    verify_fd_buffers(fs, addresses, fs.resources.get_many(addresses))
+    assert fs.resources.get_many(addresses) == [fs.resources.get(address) for address in addresses]
+
+    locations = [fs.resources.parse_address(address) for address in addresses]
+    verify_fd_buffers(fs, addresses, fs.resources.fdc.get_resources(locations))
+
+    assert dir_entries.keys() == {
         ".",
         "..",
         "file1",
@@ -109,3 +215,11 @@ def verify_fs_content(fs: vmfs.VMFS) -> None:
     symlink = dir_entries["symlink"]
     assert symlink.is_symlink()
     assert symlink.link == "file4"
+
+
+def verify_fd_buffers(fs: vmfs.VMFS, addresses: list[int], buffers: list[bytes]) -> None:
+    # Every file descriptor contains its own address, so each buffer must match the address it was requested for
+    assert len(buffers) == len(addresses)
+    for address, buf in zip(addresses, buffers):
+        assert len(buf) == fs._fd_size
+        assert c_vmfs.FS3_FileDescriptor(buf[fs._fd_descriptor_offset :]).address == address